@@ -1,19 +1,27 @@
 """Aave action provider for interacting with Aave V3 protocol."""
 
+import math
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
+from functools import partial
 from typing import Any
 
-from web3 import Web3
+from eth_abi import encode
 
 from ...network import Network
 from ...wallet_providers import EvmWalletProvider
 from ..action_decorator import create_action
 from ..action_provider import ActionProvider
 from .constants import (
-    ASSET_ADDRESSES,
-    POOL_ABI,
+    ASSET_ADDRESS_LOOKUP,
+    ERC20_SELECTORS,
     POOL_ADDRESSES,
+    POOL_SELECTORS,
+    PRICE_ORACLE_ADDRESSES,
+    PRICE_ORACLE_SELECTORS,
+    RECEIPT_POLL_LATENCY,
     SUPPORTED_NETWORKS,
+    USER_ACCOUNT_DATA_TYPES,
 )
 from .schemas import (
     AaveBorrowSchema,
@@ -25,18 +33,50 @@ from .schemas import (
 )
 from .utils import (
     approve_token,
+    batch_read,
+    encode_address_call,
     format_amount_from_decimals,
     format_amount_with_decimals,
-    get_asset_price_from_oracle,
+    get_asset_price_base_units,
     get_health_factor,
     get_portfolio_details_markdown,
+    get_token_allowance,
     get_token_balance,
     get_token_decimals,
+    get_token_metadata_cache,
     get_token_symbol,
     get_user_account_data,
+    parse_user_account_data,
     set_user_use_reserve_as_collateral,
+    update_token_metadata_cache,
 )
 
+# Health factor reported by Aave when the user has no borrows
+_INF = math.inf
+
+# Argument types of the Pool write functions
+_POOL_CALL_TYPES = {
+    "supply": ("address", "uint256", "address", "uint16"),
+    "withdraw": ("address", "uint256", "address"),
+    "borrow": ("address", "uint256", "uint256", "uint16", "address"),
+    "repay": ("address", "uint256", "uint256", "address"),
+}
+
+
+def _encode_pool_call(function_name: str, args: list[Any]) -> str:
+    """Encode the calldata for an Aave Pool write function.
+
+    Args:
+        function_name: The name of the Pool function (supply, withdraw, borrow or repay).
+        args: The arguments to the function.
+
+    Returns:
+        str: The encoded calldata as a 0x-prefixed hex string.
+
+    """
+    calldata = POOL_SELECTORS[function_name] + encode(_POOL_CALL_TYPES[function_name], args)
+    return "0x" + calldata.hex()
+
 
 class AaveActionProvider(ActionProvider[EvmWalletProvider]):
     """Provides actions for interacting with Aave V3 protocol."""
@@ -67,7 +107,7 @@ class AaveActionProvider(ActionProvider[EvmWalletProvider]):
             str: The address of the Aave Pool contract.
 
         """
-        return Web3.to_checksum_address(POOL_ADDRESSES[network.network_id])
+        return POOL_ADDRESSES[network.network_id]
 
     def _get_asset_address(self, network: Network, asset_id: str) -> str:
         """Get the asset address based on network and asset ID.
@@ -79,11 +119,195 @@ class AaveActionProvider(ActionProvider[EvmWalletProvider]):
         Returns:
             str: The address of the asset.
 
+        """
+        address = ASSET_ADDRESS_LOOKUP.get((network.network_id, asset_id))
+        if address is None:
+            raise ValueError(f"Asset {asset_id} not supported on {network.network_id}")
+        return address
+
+    def _fetch_action_context(
+        self,
+        wallet_provider: EvmWalletProvider,
+        network: Network,
+        pool_address: str,
+        asset_address: str,
+        user: str,
+        include_price: bool = False,
+        include_allowance: bool = False,
+    ) -> dict[str, Any]:
+        """Fetch the token and account state needed before executing an action.
+
+        The reads are batched into a single Multicall3 call. Any read the batch could not
+        serve, or every read if the batch itself fails, is retried individually. The
+        retries are made concurrently from short-lived threads, so the wallet provider's
+        reads must be thread-safe. A read that still fails is left out of the context and
+        its error is recorded under "errors" instead, so callers can report it or fall back.
+
+        Args:
+            wallet_provider: The wallet provider for reading from contracts.
+            network: The network of the wallet provider.
+            pool_address: The address of the Aave Pool contract.
+            asset_address: The address of the asset.
+            user: The address of the user.
+            include_price: Whether to also read the asset price from the Aave Price Oracle.
+            include_allowance: Whether to also read the user's allowance for the Pool.
+
+        Returns:
+            dict[str, Any]: Dictionary containing the token decimals, symbol, balance of
+                the user and the user's Aave account data, plus the asset price in base
+                currency units and the allowance for the Pool if requested, and the errors
+                of the reads that failed, keyed by the same names.
+
+        """
+        metadata = get_token_metadata_cache(network.chain_id, asset_address)
+
+        # Each read has its batched call and the individual read used to retry it.
+        # Decimals and symbol never change, so they are only read if not already cached
+        reads = [
+            (
+                "balance",
+                asset_address,
+                encode_address_call(ERC20_SELECTORS["balanceOf"], user),
+                ["uint256"],
+                partial(get_token_balance, wallet_provider, asset_address, user),
+            ),
+            (
+                "account_data",
+                pool_address,
+                encode_address_call(POOL_SELECTORS["getUserAccountData"], user),
+                USER_ACCOUNT_DATA_TYPES,
+                partial(get_user_account_data, wallet_provider, pool_address, user),
+            ),
+        ]
+        if "decimals" not in metadata:
+            reads.append(
+                (
+                    "decimals",
+                    asset_address,
+                    ERC20_SELECTORS["decimals"],
+                    ["uint8"],
+                    partial(get_token_decimals, wallet_provider, asset_address),
+                )
+            )
+        if "symbol" not in metadata:
+            reads.append(
+                (
+                    "symbol",
+                    asset_address,
+                    ERC20_SELECTORS["symbol"],
+                    ["string"],
+                    partial(get_token_symbol, wallet_provider, asset_address),
+                )
+            )
+        if include_price:
+            oracle_address = PRICE_ORACLE_ADDRESSES[network.network_id]
+            reads.append(
+                (
+                    "asset_price",
+                    oracle_address,
+                    encode_address_call(PRICE_ORACLE_SELECTORS["getAssetPrice"], asset_address),
+                    ["uint256"],
+                    partial(
+                        get_asset_price_base_units,
+                        wallet_provider,
+                        network.network_id,
+                        asset_address,
+                    ),
+                )
+            )
+        if include_allowance:
+            reads.append(
+                (
+                    "allowance",
+                    asset_address,
+                    encode_address_call(ERC20_SELECTORS["allowance"], user, pool_address),
+                    ["uint256"],
+                    partial(
+                        get_token_allowance, wallet_provider, asset_address, pool_address, user
+                    ),
+                )
+            )
+
+        try:
+            results = batch_read(
+                wallet_provider,
+                network.network_id,
+                [(target, data, types) for _, target, data, types, _ in reads],
+            )
+        except Exception:
+            # Multicall3 is not available, so every value is read individually
+            results = [None] * len(reads)
+
+        context: dict[str, Any] = dict(metadata)
+        retries = {}
+        for (key, _, _, _, read), result in zip(reads, results, strict=True):
+            if result is None:
+                retries[key] = read
+            elif key == "account_data":
+                context[key] = parse_user_account_data(result)
+            else:
+                context[key] = result[0]
+
+        read_metadata = {
+            key: context[key]
+            for key in ("decimals", "symbol")
+            if key in context and key not in metadata
+        }
+        if read_metadata:
+            update_token_metadata_cache(network.chain_id, asset_address, read_metadata)
+
+        errors = {}
+        if retries:
+            # Retries are rare, so their threads only live for the duration of the reads
+            with ThreadPoolExecutor(
+                max_workers=len(retries), thread_name_prefix="aave-rpc"
+            ) as executor:
+                futures = {key: executor.submit(read) for key, read in retries.items()}
+                for key, future in futures.items():
+                    try:
+                        context[key] = future.result()
+                    except Exception as e:
+                        errors[key] = e
+        context["errors"] = errors
+        return context
+
+    @staticmethod
+    def _context_value(context: dict[str, Any], key: str) -> Any:
+        """Get a value from an action context, raising the error of its read if it failed.
+
+        Args:
+            context: The context returned by _fetch_action_context.
+            key: The name of the value.
+
+        Returns:
+            Any: The value that was read.
+
+        """
+        if key not in context:
+            raise context["errors"][key]
+        return context[key]
+
+    def _fetch_post_tx_state(
+        self, wallet_provider: EvmWalletProvider, pool_address: str, user: str
+    ) -> dict[str, Any] | None:
+        """Fetch the user's Aave account state after a transaction has been confirmed.
+
+        The token symbol is already known from the pre-transaction context, so only the
+        account data needs to be read again, in a single call.
+
+        Args:
+            wallet_provider: The wallet provider for reading from contracts.
+            pool_address: The address of the Aave Pool contract.
+            user: The address of the user.
+
+        Returns:
+            dict[str, Any] | None: The user's account data, or None if it could not be read.
+
         """
         try:
-            return Web3.to_checksum_address(ASSET_ADDRESSES[network.network_id][asset_id])
-        except KeyError as err:
-            raise ValueError(f"Asset {asset_id} not supported on {network.network_id}") from err
+            return get_user_account_data(wallet_provider, pool_address, user)
+        except Exception:
+            return None
 
     @create_action(
         name="supply",
@@ -120,6 +344,7 @@ Important notes:
         try:
             validated_args = AaveSupplySchema(**args)
             network = wallet_provider.get_network()
+            user = wallet_provider.get_address()
 
             # Check if the network is supported
             if not self.supports_network(network):
@@ -138,43 +363,51 @@ Important notes:
                 return f"Error: Could not get asset address for {validated_args.asset_id} on {network.network_id}: {e!s}"
 
             try:
-                decimals = get_token_decimals(wallet_provider, asset_address)
+                context = self._fetch_action_context(
+                    wallet_provider,
+                    network,
+                    pool_address,
+                    asset_address,
+                    user,
+                    include_allowance=True,
+                )
+                decimals = self._context_value(context, "decimals")
                 amount_atomic = format_amount_with_decimals(validated_args.amount, decimals)
             except Exception as e:
                 return f"Error: Could not get token information for {validated_args.asset_id} on {network.network_id}. The token contract may not be properly deployed or accessible: {e!s}"
 
             # Check wallet balance before proceeding
             try:
-                wallet_balance = get_token_balance(wallet_provider, asset_address)
-                if wallet_balance < amount_atomic:
-                    human_balance = format_amount_from_decimals(wallet_balance, decimals)
-                    return f"Error: Insufficient balance. You have {human_balance} {validated_args.asset_id}, but trying to supply {validated_args.amount}"
+                wallet_balance = self._context_value(context, "balance")
             except Exception as e:
                 return f"Error: Could not check balance for {validated_args.asset_id} on {network.network_id}. The token contract may not be properly deployed or accessible: {e!s}"
+            if wallet_balance < amount_atomic:
+                human_balance = format_amount_from_decimals(wallet_balance, decimals)
+                return f"Error: Insufficient balance. You have {human_balance} {validated_args.asset_id}, but trying to supply {validated_args.amount}"
 
             # Get current health factor for reference
-            try:
-                current_health = get_health_factor(wallet_provider, pool_address)
-            except Exception:
-                current_health = Decimal("Infinity")  # No previous borrows
+            account_data = context.get("account_data")
+            if account_data:
+                current_health = account_data["healthFactor"]
+            else:
+                current_health = _INF  # No previous borrows
 
-            # Approve Aave to spend tokens
-            try:
-                _ = approve_token(
-                    wallet_provider, asset_address, pool_address, amount_atomic
-                )
-            except Exception as e:
-                return f"Error approving token for Aave: {e!s}"
+            # Approve Aave to spend tokens, unless the existing allowance already covers the
+            # amount. If the allowance could not be read, approve anyway
+            if context.get("allowance", 0) < amount_atomic:
+                try:
+                    _ = approve_token(
+                        wallet_provider, asset_address, pool_address, amount_atomic
+                    )
+                except Exception as e:
+                    return f"Error approving token for Aave: {e!s}"
 
             # Supply tokens to Aave
-            on_behalf_of = validated_args.on_behalf_of or wallet_provider.get_address()
-            pool_contract = Web3().eth.contract(
-                address=Web3.to_checksum_address(pool_address), abi=POOL_ABI
-            )
-            encoded_data = pool_contract.encode_abi(
+            on_behalf_of = validated_args.on_behalf_of or user
+            encoded_data = _encode_pool_call(
                 "supply",
-                args=[
-                    Web3.to_checksum_address(asset_address),
+                [
+                    asset_address,
                     amount_atomic,
                     on_behalf_of,
                     validated_args.referral_code,
@@ -182,13 +415,15 @@ Important notes:
             )
 
             params = {
-                "to": Web3.to_checksum_address(pool_address),
+                "to": pool_address,
                 "data": encoded_data,
             }
 
             try:
                 tx_hash = wallet_provider.send_transaction(params)
-                wallet_provider.wait_for_transaction_receipt(tx_hash)
+                wallet_provider.wait_for_transaction_receipt(
+                    tx_hash, poll_latency=RECEIPT_POLL_LATENCY
+                )
             except Exception as e:
                 error_msg = str(e)
                 if (
@@ -199,20 +434,17 @@ Important notes:
                 return f"Error executing supply transaction: {e!s}"
 
             # Get new health factor
-            try:
-                new_health = get_health_factor(wallet_provider, pool_address)
-            except Exception:
-                new_health = current_health  # Fallback
+            post_tx_state = self._fetch_post_tx_state(wallet_provider, pool_address, user)
+            new_health = post_tx_state["healthFactor"] if post_tx_state else current_health
 
-            token_symbol = get_token_symbol(wallet_provider, asset_address)
+            token_symbol = self._context_value(context, "symbol")
 
             # Format health factor strings and compose the final message
-            if current_health == Decimal("Infinity") and new_health == Decimal("Infinity"):
-                health_message = ""
-            else:
-                health_message = (
-                    f"\nHealth factor changed from {current_health:.2f} to {new_health:.2f}"
-                )
+            health_message = (
+                ""
+                if current_health == new_health == _INF
+                else f"\nHealth factor changed from {current_health:.2f} to {new_health:.2f}"
+            )
 
             return (
                 f"Successfully supplied {validated_args.amount} {token_symbol} to Aave.\n"
@@ -257,47 +489,50 @@ Important notes:
         try:
             validated_args = AaveWithdrawSchema(**args)
             network = wallet_provider.get_network()
+            user = wallet_provider.get_address()
             pool_address = self._get_pool_address(network)
             asset_address = self._get_asset_address(network, validated_args.asset_id)
 
-            decimals = get_token_decimals(wallet_provider, asset_address)
+            try:
+                context = self._fetch_action_context(
+                    wallet_provider, network, pool_address, asset_address, user
+                )
+                account_data = self._context_value(context, "account_data")
+            except Exception as e:
+                return f"Error checking account data: {e!s}"
+
+            decimals = self._context_value(context, "decimals")
             amount_atomic = format_amount_with_decimals(validated_args.amount, decimals)
 
             # Get current health factor for reference
-            try:
-                current_health = get_health_factor(wallet_provider, pool_address)
-
-                # Check if the user has active borrows and the health factor could be affected
-                account_data = get_user_account_data(wallet_provider, pool_address)
-                has_borrows = account_data["totalDebtBaseUnits"] > 0
+            current_health = account_data["healthFactor"]
 
-                if has_borrows and validated_args.amount == "max":
-                    return "Error: You have active borrows. You cannot withdraw all your collateral. Specify an exact amount instead."
-            except Exception as e:
-                return f"Error checking account data: {e!s}"
+            # Check if the user has active borrows and the health factor could be affected
+            has_borrows = account_data["totalDebtBaseUnits"] > 0
+            if has_borrows and validated_args.amount == "max":
+                return "Error: You have active borrows. You cannot withdraw all your collateral. Specify an exact amount instead."
 
             # Execute withdraw from Aave
-            to_address = validated_args.to or wallet_provider.get_address()
-            pool_contract = Web3().eth.contract(
-                address=Web3.to_checksum_address(pool_address), abi=POOL_ABI
-            )
-            encoded_data = pool_contract.encode_abi(
+            to_address = validated_args.to or user
+            encoded_data = _encode_pool_call(
                 "withdraw",
-                args=[
-                    Web3.to_checksum_address(asset_address),
+                [
+                    asset_address,
                     amount_atomic,
                     to_address,
                 ],
             )
 
             params = {
-                "to": Web3.to_checksum_address(pool_address),
+                "to": pool_address,
                 "data": encoded_data,
             }
 
             try:
                 tx_hash = wallet_provider.send_transaction(params)
-                receipt = wallet_provider.wait_for_transaction_receipt(tx_hash)
+                receipt = wallet_provider.wait_for_transaction_receipt(
+                    tx_hash, poll_latency=RECEIPT_POLL_LATENCY
+                )
 
                 # Check if the transaction was successful
                 if receipt.status != 1:
@@ -306,23 +541,20 @@ Important notes:
                 return f"Error executing withdraw transaction: {e!s}"
 
             # Get new health factor
-            try:
-                new_health = get_health_factor(wallet_provider, pool_address)
-            except Exception:
-                new_health = Decimal("Infinity")  # Fallback
+            post_tx_state = self._fetch_post_tx_state(wallet_provider, pool_address, user)
+            new_health = post_tx_state["healthFactor"] if post_tx_state else _INF
 
-            token_symbol = get_token_symbol(wallet_provider, asset_address)
+            token_symbol = self._context_value(context, "symbol")
             amount_display = (
                 validated_args.amount if validated_args.amount != "max" else "all available"
             )
 
             # Format health factor strings and compose the final message
-            if current_health == Decimal("Infinity") and new_health == Decimal("Infinity"):
-                health_message = ""
-            else:
-                health_message = (
-                    f"\nHealth factor changed from {current_health:.2f} to {new_health:.2f}"
-                )
+            health_message = (
+                ""
+                if current_health == new_health == _INF
+                else f"\nHealth factor changed from {current_health:.2f} to {new_health:.2f}"
+            )
 
             return (
                 f"Successfully withdrew {amount_display} {token_symbol} from Aave.\n"
@@ -369,61 +601,46 @@ Important notes:
         try:
             validated_args = AaveBorrowSchema(**args)
             network = wallet_provider.get_network()
+            user = wallet_provider.get_address()
             pool_address = self._get_pool_address(network)
             asset_address = self._get_asset_address(network, validated_args.asset_id)
 
-            decimals = get_token_decimals(wallet_provider, asset_address)
-            amount_atomic = format_amount_with_decimals(validated_args.amount, decimals)
-
-            # Check collateral and borrowing capacity
+            # Check collateral and borrowing capacity, reading the asset price in the same batch
             try:
-                account_data = get_user_account_data(wallet_provider, pool_address)
-                if account_data["totalCollateralBaseUnits"] == 0:
-                    return "Error: You have no collateral supplied. Supply assets as collateral before borrowing."
-
-                # Get asset price from oracle for accurate USD conversion
-                network = wallet_provider.get_network()
-                network_id = network.network_id
-
-                try:
-                    # Get asset price from Aave Oracle
-                    asset_price = get_asset_price_from_oracle(
-                        wallet_provider, network_id, asset_address
-                    )
-
-                    # Calculate USD value of borrow amount
-                    amount_decimal = Decimal(validated_args.amount)
-                    # Asset price is already in USD base units (scaled by 10^8)
-                    estimated_borrow_base_units = (
-                        amount_decimal * asset_price * Decimal(10 ** (8 - decimals))
-                    )
-
-                    # Compare with available borrows (also in USD base units)
-                    if estimated_borrow_base_units > account_data["availableBorrowsBaseUnits"]:
-                        # Convert to human-readable USD for error message
-                        max_borrow_usd = account_data["availableBorrowsUSD"]
-                        token_symbol = get_token_symbol(wallet_provider, asset_address)
-                        return f"Error: Insufficient borrowing capacity. You can borrow up to ${max_borrow_usd:.4f} worth of assets."
-                except Exception as e:
-                    # Fallback to simpler check if oracle fails
-                    if account_data["availableBorrowsBaseUnits"] == 0:
-                        return "Error: You have no borrowing capacity available."
-                    return f"Error getting asset price: {e}. Please try again."
+                context = self._fetch_action_context(
+                    wallet_provider,
+                    network,
+                    pool_address,
+                    asset_address,
+                    user,
+                    include_price=True,
+                )
+                decimals = self._context_value(context, "decimals")
+                amount_atomic = format_amount_with_decimals(validated_args.amount, decimals)
+                account_data = self._context_value(context, "account_data")
+                asset_price = self._context_value(context, "asset_price")
             except Exception as e:
                 return f"Error checking account data: {e!s}"
 
+            if account_data["totalCollateralBaseUnits"] == 0:
+                return "Error: You have no collateral supplied. Supply assets as collateral before borrowing."
+
+            # Value of the borrow in base currency units (USD scaled by 10^8), like the
+            # available borrows reported by the Pool
+            borrow_base_units = amount_atomic * asset_price // 10**decimals
+            if borrow_base_units > account_data["availableBorrowsBaseUnits"]:
+                max_borrow_usd = account_data["availableBorrowsUSD"]
+                return f"Error: Insufficient borrowing capacity. You can borrow up to ${max_borrow_usd:.4f} worth of assets."
+
             # Get current health factor for reference
             current_health = account_data["healthFactor"]
 
             # Execute borrow from Aave
-            on_behalf_of = validated_args.on_behalf_of or wallet_provider.get_address()
-            pool_contract = Web3().eth.contract(
-                address=Web3.to_checksum_address(pool_address), abi=POOL_ABI
-            )
-            encoded_data = pool_contract.encode_abi(
+            on_behalf_of = validated_args.on_behalf_of or user
+            encoded_data = _encode_pool_call(
                 "borrow",
-                args=[
-                    Web3.to_checksum_address(asset_address),
+                [
+                    asset_address,
                     amount_atomic,
                     validated_args.interest_rate_mode,
                     validated_args.referral_code,
@@ -432,13 +649,15 @@ Important notes:
             )
 
             params = {
-                "to": Web3.to_checksum_address(pool_address),
+                "to": pool_address,
                 "data": encoded_data,
             }
 
             try:
                 tx_hash = wallet_provider.send_transaction(params)
-                receipt = wallet_provider.wait_for_transaction_receipt(tx_hash)
+                receipt = wallet_provider.wait_for_transaction_receipt(
+                    tx_hash, poll_latency=RECEIPT_POLL_LATENCY
+                )
 
                 # Check if the transaction was successful
                 if receipt.status != 1:
@@ -446,19 +665,16 @@ Important notes:
             except Exception as e:
                 return f"Error executing borrow transaction: {e!s}"
 
-            # Get new health factor
-            try:
-                new_account_data = get_user_account_data(wallet_provider, pool_address)
-                new_health = new_account_data["healthFactor"]
-            except Exception:
-                new_health = Decimal("0")  # Default to show warning
+            # Get new health factor, defaulting to 0 to show the warning if it can't be read
+            post_tx_state = self._fetch_post_tx_state(wallet_provider, pool_address, user)
+            new_health = post_tx_state["healthFactor"] if post_tx_state else 0.0
 
-            token_symbol = get_token_symbol(wallet_provider, asset_address)
+            token_symbol = self._context_value(context, "symbol")
             interest_mode = "variable" if validated_args.interest_rate_mode == 2 else "stable"
 
             # Warning message if health factor is low
             warning_message = ""
-            if new_health < 1.1 and new_health != Decimal("Infinity"):
+            if new_health < 1.1 and new_health != _INF:
                 warning_message = f"\n⚠️ WARNING: Your health factor is now {new_health:.2f}, which is dangerously low. Consider repaying some debt or adding more collateral to avoid liquidation."
 
             return (
@@ -506,42 +722,51 @@ Important notes:
         try:
             validated_args = AaveRepaySchema(**args)
             network = wallet_provider.get_network()
+            user = wallet_provider.get_address()
             pool_address = self._get_pool_address(network)
             asset_address = self._get_asset_address(network, validated_args.asset_id)
 
-            decimals = get_token_decimals(wallet_provider, asset_address)
+            context = self._fetch_action_context(
+                wallet_provider,
+                network,
+                pool_address,
+                asset_address,
+                user,
+                include_allowance=True,
+            )
+            decimals = self._context_value(context, "decimals")
             amount_atomic = format_amount_with_decimals(validated_args.amount, decimals)
 
             # Check wallet balance if not using max (which will use available balance)
             if validated_args.amount != "max":
-                wallet_balance = get_token_balance(wallet_provider, asset_address)
+                wallet_balance = self._context_value(context, "balance")
                 if wallet_balance < amount_atomic:
                     human_balance = format_amount_from_decimals(wallet_balance, decimals)
                     return f"Error: Insufficient balance. You have {human_balance} {validated_args.asset_id}, but trying to repay {validated_args.amount}"
 
             # Get current health factor for reference
-            try:
-                current_health = get_health_factor(wallet_provider, pool_address)
-            except Exception:
-                current_health = Decimal("Infinity")  # No borrows (unlikely if repaying)
+            account_data = context.get("account_data")
+            if account_data:
+                current_health = account_data["healthFactor"]
+            else:
+                current_health = _INF  # No borrows (unlikely if repaying)
 
-            # Approve Aave to spend tokens (not needed for max amount, but safer to approve anyway)
-            try:
-                _ = approve_token(
-                    wallet_provider, asset_address, pool_address, amount_atomic
-                )
-            except Exception as e:
-                return f"Error approving token: {e!s}"
+            # Approve Aave to spend tokens, unless the existing allowance already covers the
+            # amount. If the allowance could not be read, approve anyway
+            if context.get("allowance", 0) < amount_atomic:
+                try:
+                    _ = approve_token(
+                        wallet_provider, asset_address, pool_address, amount_atomic
+                    )
+                except Exception as e:
+                    return f"Error approving token: {e!s}"
 
             # Execute repay to Aave
-            on_behalf_of = validated_args.on_behalf_of or wallet_provider.get_address()
-            pool_contract = Web3().eth.contract(
-                address=Web3.to_checksum_address(pool_address), abi=POOL_ABI
-            )
-            encoded_data = pool_contract.encode_abi(
+            on_behalf_of = validated_args.on_behalf_of or user
+            encoded_data = _encode_pool_call(
                 "repay",
-                args=[
-                    Web3.to_checksum_address(asset_address),
+                [
+                    asset_address,
                     amount_atomic,
                     validated_args.interest_rate_mode,
                     on_behalf_of,
@@ -549,13 +774,15 @@ Important notes:
             )
 
             params = {
-                "to": Web3.to_checksum_address(pool_address),
+                "to": pool_address,
                 "data": encoded_data,
             }
 
             try:
                 tx_hash = wallet_provider.send_transaction(params)
-                receipt = wallet_provider.wait_for_transaction_receipt(tx_hash)
+                receipt = wallet_provider.wait_for_transaction_receipt(
+                    tx_hash, poll_latency=RECEIPT_POLL_LATENCY
+                )
 
                 # Check if the transaction was successful
                 if receipt.status != 1:
@@ -564,19 +791,17 @@ Important notes:
                 return f"Error executing repay transaction: {e!s}"
 
             # Get new health factor
-            try:
-                new_health = get_health_factor(wallet_provider, pool_address)
-            except Exception:
-                new_health = current_health  # Fallback
+            post_tx_state = self._fetch_post_tx_state(wallet_provider, pool_address, user)
+            new_health = post_tx_state["healthFactor"] if post_tx_state else current_health
 
-            token_symbol = get_token_symbol(wallet_provider, asset_address)
+            token_symbol = self._context_value(context, "symbol")
             amount_display = (
                 validated_args.amount if validated_args.amount != "max" else "all outstanding"
             )
             interest_mode = "variable" if validated_args.interest_rate_mode == 2 else "stable"
 
             # Format health factor strings and compose the final message
-            if new_health == Decimal("Infinity"):
+            if new_health == _INF:
                 health_message = "\nYou have repaid all your debt and have no active borrows."
             else:
                 health_message = (
@@ -659,14 +884,15 @@ Important notes:
         try:
             validated_args = AaveSetAsCollateralSchema(**args)
             network = wallet_provider.get_network()
+            user = wallet_provider.get_address()
             pool_address = self._get_pool_address(network)
             asset_address = self._get_asset_address(network, validated_args.asset_id)
 
             # Get current health factor for reference
             try:
-                current_health = get_health_factor(wallet_provider, pool_address)
+                current_health = get_health_factor(wallet_provider, pool_address, user)
             except Exception:
-                current_health = Decimal("Infinity")  # No previous borrows
+                current_health = _INF  # No previous borrows
 
             # Execute setUserUseReserveAsCollateral
             try:
@@ -676,36 +902,31 @@ Important notes:
             except Exception as e:
                 return f"Error setting asset as collateral: {e!s}"
 
-            # Get new health factor
-            try:
-                new_health = get_health_factor(wallet_provider, pool_address)
-            except Exception:
+            # Get account data once to see the changes in health factor and collateral
+            account_data = self._fetch_post_tx_state(wallet_provider, pool_address, user)
+            if account_data:
+                new_health = account_data["healthFactor"]
+                collateral_usd = account_data["totalCollateralUSD"]
+                collateral_base_units = account_data["totalCollateralBaseUnits"]
+            else:
                 new_health = current_health  # Fallback
+                collateral_usd = Decimal("0")
+                collateral_base_units = 0
 
             token_symbol = get_token_symbol(wallet_provider, asset_address)
 
-            # Get account data to see the changes in collateral
-            try:
-                account_data = get_user_account_data(wallet_provider, pool_address)
-                collateral_eth = account_data["totalCollateralBase"]
-                collateral_wei = account_data["totalCollateralWei"]
-            except Exception:
-                collateral_eth = Decimal("0")
-                collateral_wei = 0
-
             # Format health factor strings and compose the final message
-            if current_health == Decimal("Infinity") and new_health == Decimal("Infinity"):
-                health_message = ""
-            else:
-                health_message = (
-                    f"\nHealth factor changed from {current_health:.2f} to {new_health:.2f}"
-                )
+            health_message = (
+                ""
+                if current_health == new_health == _INF
+                else f"\nHealth factor changed from {current_health:.2f} to {new_health:.2f}"
+            )
 
             action = "enabled" if validated_args.use_as_collateral else "disabled"
             return (
                 f"Successfully {action} {token_symbol} as collateral.\n"
                 f"Transaction hash: {tx_hash}\n"
-                f"Total collateral now: {collateral_eth} ETH ({collateral_wei} Wei)"
+                f"Total collateral now: {collateral_usd:.2f} USD ({collateral_base_units} base units)"
                 f"{health_message}"
             )
         except Exception as e:
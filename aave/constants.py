@@ -1,13 +1,38 @@
 """Constants for Aave action provider."""
 
-SUPPORTED_NETWORKS = ["base-mainnet", "base-sepolia"]
+from types import MappingProxyType
+
+from eth_utils import function_abi_to_4byte_selector
+from web3 import Web3
+
+from ..erc20.constants import ERC20_ABI
+
+SUPPORTED_NETWORKS = frozenset({"base-mainnet", "base-sepolia"})
+
+# Interval in seconds between transaction receipt polls, kept well below the 2 s Base block time
+RECEIPT_POLL_LATENCY = 0.05
+
+
+def _checksummed(addresses: dict[str, str]) -> MappingProxyType[str, str]:
+    """Checksum the addresses of a mapping and make it read-only.
+
+    Args:
+        addresses: The addresses, keyed by network ID or asset ID.
+
+    Returns:
+        MappingProxyType[str, str]: A read-only mapping of the checksummed addresses.
+
+    """
+    return MappingProxyType({k: Web3.to_checksum_address(v) for k, v in addresses.items()})
+
 
 # Asset addresses for supported networks
-ASSET_ADDRESSES = {
+_RAW_ASSET_ADDRESSES = {
     "base-mainnet": {
         "weth": "0x4200000000000000000000000000000000000006",
         "usdc": "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
         "cbeth": "0x2Ae3F1Ec7F1F5012CFEab0185bfc7aa3cf0DEc22",
+        "wsteth": "0xc1CBa3fCea344f92D9239c08C0568f6F2F0ee452",
     },
     "base-sepolia": {
         "weth": "0x4200000000000000000000000000000000000006",
@@ -16,17 +41,41 @@ ASSET_ADDRESSES = {
 }
 
 # Pool contract addresses
-POOL_ADDRESSES = {
-    "base-mainnet": "0xa238dd80c259a72e81d7e4664a9801593f98d1c5",
+_RAW_POOL_ADDRESSES = {
+    "base-mainnet": "0xA238Dd80C259a72e81d7e4664a9801593F98d1c5",
     "base-sepolia": "0x6Ae43d3271ff6888e7Fc43Fd7321a503ff738951",
 }
 
 # Aave Price Oracle addresses
-PRICE_ORACLE_ADDRESSES = {
+_RAW_PRICE_ORACLE_ADDRESSES = {
     "base-mainnet": "0x2Cc0Fc26eD4563A5ce5e8bdcfe1A2878676Ae156",
     "base-sepolia": "0x2Cc0Fc26eD4563A5ce5e8bdcfe1A2878676Ae156",
 }
 
+# Multicall3 contract addresses
+_RAW_MULTICALL3_ADDRESSES = {
+    "base-mainnet": "0xcA11bde05977b3631167028862bE2a173976CA11",
+    "base-sepolia": "0xcA11bde05977b3631167028862bE2a173976CA11",
+}
+
+# Checksum all addresses once at import so callers can use them directly, and freeze the
+# mappings so they can be shared safely
+ASSET_ADDRESSES = MappingProxyType(
+    {network_id: _checksummed(assets) for network_id, assets in _RAW_ASSET_ADDRESSES.items()}
+)
+POOL_ADDRESSES = _checksummed(_RAW_POOL_ADDRESSES)
+PRICE_ORACLE_ADDRESSES = _checksummed(_RAW_PRICE_ORACLE_ADDRESSES)
+MULTICALL3_ADDRESSES = _checksummed(_RAW_MULTICALL3_ADDRESSES)
+
+# Asset addresses keyed by (network ID, asset ID), so resolving an asset is a single lookup
+ASSET_ADDRESS_LOOKUP = MappingProxyType(
+    {
+        (network_id, asset_id): address
+        for network_id, assets in ASSET_ADDRESSES.items()
+        for asset_id, address in assets.items()
+    }
+)
+
 # ABI for Aave V3 Pool contract - essential functions
 POOL_ABI = [
     # supply function
@@ -109,6 +158,9 @@ POOL_ABI = [
     },
 ]
 
+# Return types of getUserAccountData, for decoding its raw (e.g. batched) results
+USER_ACCOUNT_DATA_TYPES = ("uint256",) * 6
+
 # Aave Price Oracle ABI - essential functions
 PRICE_ORACLE_ABI = [
     {
@@ -119,10 +171,103 @@ PRICE_ORACLE_ABI = [
         "type": "function",
     },
     {
-        "inputs": [],
-        "name": "BASE_CURRENCY_UNIT",
+        "inputs": [{"internalType": "address[]", "name": "assets", "type": "address[]"}],
+        "name": "getAssetsPrices",
+        "outputs": [{"internalType": "uint256[]", "name": "", "type": "uint256[]"}],
+        "stateMutability": "view",
+        "type": "function",
+    },
+]
+
+# Multicall3 ABI - essential functions
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"internalType": "address", "name": "target", "type": "address"},
+                    {"internalType": "bool", "name": "allowFailure", "type": "bool"},
+                    {"internalType": "bytes", "name": "callData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Call3[]",
+                "name": "calls",
+                "type": "tuple[]",
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"internalType": "bool", "name": "success", "type": "bool"},
+                    {"internalType": "bytes", "name": "returnData", "type": "bytes"},
+                ],
+                "internalType": "struct Multicall3.Result[]",
+                "name": "returnData",
+                "type": "tuple[]",
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function",
+    },
+]
+
+# ERC20 allowance ABI, not included in the shared ERC20 ABI
+ERC20_ALLOWANCE_ABI = [
+    {
+        "inputs": [
+            {"internalType": "address", "name": "owner", "type": "address"},
+            {"internalType": "address", "name": "spender", "type": "address"},
+        ],
+        "name": "allowance",
         "outputs": [{"internalType": "uint256", "name": "", "type": "uint256"}],
         "stateMutability": "view",
         "type": "function",
     },
 ]
+
+
+def _function_selectors(abi: list[dict]) -> MappingProxyType[str, bytes]:
+    """Compute the 4-byte selector of every function in an ABI.
+
+    Args:
+        abi: The contract ABI.
+
+    Returns:
+        MappingProxyType[str, bytes]: The selector of each function, keyed by function name.
+
+    """
+    return MappingProxyType(
+        {
+            entry["name"]: function_abi_to_4byte_selector(entry)
+            for entry in abi
+            if entry["type"] == "function"
+        }
+    )
+
+
+# Function selectors, computed once at import so calldata can be encoded without web3 contracts
+POOL_SELECTORS = _function_selectors(POOL_ABI)
+PRICE_ORACLE_SELECTORS = _function_selectors(PRICE_ORACLE_ABI)
+ERC20_SELECTORS = _function_selectors(ERC20_ABI + ERC20_ALLOWANCE_ABI)
+
+
+def _function_abis(abi: list[dict]) -> MappingProxyType[str, list[dict]]:
+    """Split an ABI into single-function ABIs.
+
+    Args:
+        abi: The contract ABI.
+
+    Returns:
+        MappingProxyType[str, list[dict]]: A one-entry ABI for each function, keyed by
+            function name.
+
+    """
+    return MappingProxyType(
+        {entry["name"]: [entry] for entry in abi if entry["type"] == "function"}
+    )
+
+
+# Single-function ABIs, so contract reads only make web3 process the function being called
+POOL_FUNCTION_ABIS = _function_abis(POOL_ABI)
+PRICE_ORACLE_FUNCTION_ABIS = _function_abis(PRICE_ORACLE_ABI)
+ERC20_FUNCTION_ABIS = _function_abis(ERC20_ABI + ERC20_ALLOWANCE_ABI)
@@ -2,13 +2,21 @@
 
 from typing import Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Asset IDs accepted by the actions; availability on each network is checked by the provider
+AssetId = Literal["weth", "usdc", "cbeth", "wsteth"]
+
+# Validated arguments are read-only, and stray whitespace around LLM-supplied strings is dropped
+SCHEMA_CONFIG = ConfigDict(frozen=True, str_strip_whitespace=True)
 
 
 class AaveSupplySchema(BaseModel):
     """Input schema for supplying assets to Aave."""
 
-    asset_id: Literal["weth", "usdc", "cbeth", "wsteth"] = Field(
+    model_config = SCHEMA_CONFIG
+
+    asset_id: AssetId = Field(
         ...,
         description="The asset ID to supply to the Aave market, one of `weth`, `usdc`, `cbeth`, or `wsteth`",
     )
@@ -29,7 +37,9 @@ class AaveSupplySchema(BaseModel):
 class AaveWithdrawSchema(BaseModel):
     """Input schema for withdrawing assets from Aave."""
 
-    asset_id: Literal["weth", "usdc", "cbeth", "wsteth"] = Field(
+    model_config = SCHEMA_CONFIG
+
+    asset_id: AssetId = Field(
         ...,
         description="The asset ID to withdraw from the Aave market, one of `weth`, `usdc`, `cbeth`, or `wsteth`",
     )
@@ -46,7 +56,9 @@ class AaveWithdrawSchema(BaseModel):
 class AaveBorrowSchema(BaseModel):
     """Input schema for borrowing assets from Aave."""
 
-    asset_id: Literal["weth", "usdc", "cbeth", "wsteth"] = Field(
+    model_config = SCHEMA_CONFIG
+
+    asset_id: AssetId = Field(
         ...,
         description="The asset ID to borrow from the Aave market, one of `weth`, `usdc`, `cbeth`, or `wsteth`",
     )
@@ -71,7 +83,9 @@ class AaveBorrowSchema(BaseModel):
 class AaveRepaySchema(BaseModel):
     """Input schema for repaying borrowed assets to Aave."""
 
-    asset_id: Literal["weth", "usdc", "cbeth", "wsteth"] = Field(
+    model_config = SCHEMA_CONFIG
+
+    asset_id: AssetId = Field(
         ...,
         description="The asset ID to repay to the Aave market, one of `weth`, `usdc`, `cbeth`, or `wsteth`",
     )
@@ -92,6 +106,8 @@ class AaveRepaySchema(BaseModel):
 class AaveSetAsCollateralSchema(BaseModel):
     """Schema for setting an asset as collateral in Aave."""
 
+    model_config = SCHEMA_CONFIG
+
     asset_id: str = Field(
         description="The asset ID to set as collateral, one of `weth`, `usdc`, `cbeth`, or `wsteth`",
     )
@@ -104,6 +120,8 @@ class AaveSetAsCollateralSchema(BaseModel):
 class AavePortfolioSchema(BaseModel):
     """Input schema for getting portfolio details from Aave."""
 
+    model_config = SCHEMA_CONFIG
+
     account: str | None = Field(
         None,
         description="Optional address to get portfolio details for. Defaults to wallet address.",
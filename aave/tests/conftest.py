@@ -3,10 +3,17 @@ from unittest.mock import MagicMock
 import pytest
 
 from coinbase_agentkit.action_providers.aave.aave_action_provider import AaveActionProvider
+from coinbase_agentkit.action_providers.aave.utils import _token_metadata_cache
 from coinbase_agentkit.network import Network
 from coinbase_agentkit.wallet_providers import EvmWalletProvider
 
 
+@pytest.fixture(autouse=True)
+def clear_aave_caches():
+    """Clear the Aave caches so that tests do not share cached reads."""
+    _token_metadata_cache.clear()
+
+
 @pytest.fixture
 def aave_wallet():
     """Create a mock wallet provider for testing Aave action provider."""
@@ -20,9 +27,9 @@ def aave_wallet():
     return mock_wallet
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def aave_provider():
-    """Create an AaveActionProvider instance for testing."""
+    """Create an AaveActionProvider instance shared by the tests, as it holds no state."""
     return AaveActionProvider()
 
 
@@ -0,0 +1,67 @@
+from unittest.mock import patch
+
+
+def _account_data(available_borrows_base_units):
+    return {
+        "totalCollateralBaseUnits": 10_000 * 10**8,
+        "availableBorrowsBaseUnits": available_borrows_base_units,
+        "availableBorrowsUSD": available_borrows_base_units / 10**8,
+        "healthFactor": 2.0,
+    }
+
+
+def test_borrow_action_success(aave_wallet, aave_provider):
+    """Test that the borrow action succeeds when the amount is within borrowing capacity."""
+    provider = aave_provider
+    input_args = {"asset_id": "usdc", "amount": "100", "interest_rate_mode": 2}
+
+    with (
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider._encode_pool_call"
+        ) as mock_encode_pool_call,
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_user_account_data"
+        ) as mock_get_user_account_data,
+        patch.object(provider, "_fetch_action_context") as mock_fetch_action_context,
+    ):
+        # 100 USDC at $1.00 is exactly the available borrowing capacity
+        mock_fetch_action_context.return_value = {
+            "decimals": 6,
+            "symbol": "USDC",
+            "balance": 0,
+            "account_data": _account_data(100 * 10**8),
+            "asset_price": 10**8,
+        }
+        mock_get_user_account_data.return_value = {"healthFactor": 1.5}
+        mock_encode_pool_call.return_value = "0xencoded_borrow_data"
+        aave_wallet.send_transaction.return_value = "0xtx_hash"
+        aave_wallet.wait_for_transaction_receipt.return_value.status = 1
+
+        result = provider.borrow(aave_wallet, input_args)
+
+        assert "Successfully borrowed 100 USDC" in result
+        assert "Health factor changed from 2.00 to 1.50" in result
+        assert mock_fetch_action_context.call_args.kwargs["include_price"] is True
+        aave_wallet.send_transaction.assert_called_once()
+
+
+def test_borrow_insufficient_capacity(aave_wallet, aave_provider):
+    """Test that the borrow action fails when the amount exceeds borrowing capacity."""
+    provider = aave_provider
+    input_args = {"asset_id": "weth", "amount": "1", "interest_rate_mode": 2}
+
+    with patch.object(provider, "_fetch_action_context") as mock_fetch_action_context:
+        # 1 WETH at $3000 against $2999 of available borrows
+        mock_fetch_action_context.return_value = {
+            "decimals": 18,
+            "symbol": "WETH",
+            "balance": 0,
+            "account_data": _account_data(2999 * 10**8),
+            "asset_price": 3000 * 10**8,
+        }
+
+        result = provider.borrow(aave_wallet, input_args)
+
+        assert "Insufficient borrowing capacity" in result
+        assert "$2999.0000" in result
+        aave_wallet.send_transaction.assert_not_called()
@@ -1,3 +1,26 @@
+from unittest.mock import patch
+
+from eth_abi import encode
+from web3 import Web3
+
+from coinbase_agentkit.action_providers.aave.aave_action_provider import _encode_pool_call
+from coinbase_agentkit.action_providers.aave.constants import (
+    ERC20_SELECTORS,
+    POOL_ABI,
+    POOL_SELECTORS,
+    PRICE_ORACLE_SELECTORS,
+)
+from coinbase_agentkit.action_providers.aave.utils import (
+    _token_metadata_cache,
+    approve_token,
+    encode_address_call,
+    get_asset_prices_base_units,
+    get_token_decimals,
+    get_users_account_data,
+    parse_user_account_data,
+    set_user_use_reserve_as_collateral,
+)
+from coinbase_agentkit.action_providers.erc20.constants import ERC20_ABI
 from coinbase_agentkit.network import Network
 
 
@@ -46,3 +69,285 @@ def test_get_asset_address_invalid_network(aave_provider):
     except (KeyError, ValueError):
         # Accept either KeyError or ValueError since the implementation might use either
         pass
+
+def test_fetch_action_context_multicall(aave_provider, aave_wallet, aave_fixtures):
+    """Test that _fetch_action_context decodes the batched Multicall3 results."""
+    aave_wallet.read_contract.return_value = [
+        (True, encode(["uint256"], [5 * 10**18])),
+        (True, encode(["uint256"] * 6, [100 * 10**8, 0, 80 * 10**8, 8300, 8000, 0])),
+        (True, encode(["uint8"], [18])),
+        (True, encode(["string"], ["WETH"])),
+    ]
+
+    context = aave_provider._fetch_action_context(
+        aave_wallet,
+        aave_wallet.get_network(),
+        aave_fixtures["pool_address"],
+        aave_fixtures["asset_addresses"]["weth"],
+        "0x1234567890123456789012345678901234567890",
+    )
+
+    assert context["decimals"] == 18
+    assert context["symbol"] == "WETH"
+    assert context["balance"] == 5 * 10**18
+    assert context["account_data"]["totalCollateralBaseUnits"] == 100 * 10**8
+    aave_wallet.read_contract.assert_called_once()
+    assert aave_wallet.read_contract.call_args.kwargs["function_name"] == "aggregate3"
+
+def test_fetch_action_context_uses_cached_metadata(aave_provider, aave_wallet, aave_fixtures):
+    """Test that cached decimals and symbol are not read again in the Multicall3 batch."""
+    user = "0x1234567890123456789012345678901234567890"
+    account_data = encode(["uint256"] * 6, [0, 0, 0, 0, 0, 0])
+    aave_wallet.read_contract.return_value = [
+        (True, encode(["uint256"], [10**6])),
+        (True, account_data),
+        (True, encode(["uint8"], [6])),
+        (True, encode(["string"], ["USDC"])),
+    ]
+    aave_provider._fetch_action_context(
+        aave_wallet,
+        aave_wallet.get_network(),
+        aave_fixtures["pool_address"],
+        aave_fixtures["asset_addresses"]["usdc"],
+        user,
+    )
+
+    aave_wallet.read_contract.return_value = [
+        (True, encode(["uint256"], [2 * 10**6])),
+        (True, account_data),
+    ]
+    context = aave_provider._fetch_action_context(
+        aave_wallet,
+        aave_wallet.get_network(),
+        aave_fixtures["pool_address"],
+        aave_fixtures["asset_addresses"]["usdc"],
+        user,
+    )
+
+    assert context["decimals"] == 6
+    assert context["symbol"] == "USDC"
+    assert context["balance"] == 2 * 10**6
+    assert len(aave_wallet.read_contract.call_args.kwargs["args"][0]) == 2
+
+def test_get_token_decimals_failed_read_not_cached(aave_wallet, aave_fixtures):
+    """Test that a failed decimals read leaves no entry in the metadata cache."""
+    aave_wallet.read_contract.side_effect = Exception("RPC unavailable")
+
+    try:
+        get_token_decimals(aave_wallet, aave_fixtures["asset_addresses"]["usdc"])
+        raise AssertionError("Should have raised an exception")
+    except Exception as e:
+        assert "RPC unavailable" in str(e)
+    assert not _token_metadata_cache
+
+def test_fetch_action_context_fallback(aave_provider, aave_wallet, aave_fixtures):
+    """Test that _fetch_action_context falls back to individual reads if Multicall3 fails."""
+    with (
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.batch_read"
+        ) as mock_batch_read,
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_decimals"
+        ) as mock_get_token_decimals,
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_symbol"
+        ) as mock_get_token_symbol,
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_balance"
+        ) as mock_get_token_balance,
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_user_account_data"
+        ) as mock_get_user_account_data,
+    ):
+        mock_batch_read.side_effect = Exception("Multicall3 not deployed")
+        mock_get_token_decimals.return_value = 6
+        mock_get_token_symbol.return_value = "USDC"
+        mock_get_token_balance.return_value = 10**6
+        mock_get_user_account_data.return_value = {"totalDebtBaseUnits": 0}
+
+        user = "0x1234567890123456789012345678901234567890"
+        context = aave_provider._fetch_action_context(
+            aave_wallet,
+            aave_wallet.get_network(),
+            aave_fixtures["pool_address"],
+            aave_fixtures["asset_addresses"]["usdc"],
+            user,
+        )
+
+        mock_get_token_balance.assert_called_once_with(
+            aave_wallet, aave_fixtures["asset_addresses"]["usdc"], user
+        )
+        assert context == {
+            "decimals": 6,
+            "symbol": "USDC",
+            "balance": 10**6,
+            "account_data": {"totalDebtBaseUnits": 0},
+            "errors": {},
+        }
+
+def test_fetch_action_context_retries_failed_reads(aave_provider, aave_wallet, aave_fixtures):
+    """Test that only the reads that failed in the Multicall3 batch are retried individually."""
+    user = "0x1234567890123456789012345678901234567890"
+    aave_wallet.read_contract.return_value = [
+        (False, b""),
+        (False, b""),
+        (True, encode(["uint8"], [6])),
+        (True, encode(["string"], ["USDC"])),
+    ]
+
+    with (
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_balance"
+        ) as mock_get_token_balance,
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_user_account_data"
+        ) as mock_get_user_account_data,
+    ):
+        mock_get_token_balance.return_value = 10**6
+        mock_get_user_account_data.side_effect = Exception("RPC unavailable")
+
+        context = aave_provider._fetch_action_context(
+            aave_wallet,
+            aave_wallet.get_network(),
+            aave_fixtures["pool_address"],
+            aave_fixtures["asset_addresses"]["usdc"],
+            user,
+        )
+
+        mock_get_token_balance.assert_called_once_with(
+            aave_wallet, aave_fixtures["asset_addresses"]["usdc"], user
+        )
+        assert context["decimals"] == 6
+        assert context["symbol"] == "USDC"
+        assert context["balance"] == 10**6
+        assert "account_data" not in context
+        assert str(context["errors"]["account_data"]) == "RPC unavailable"
+        aave_wallet.read_contract.assert_called_once()
+
+def test_encode_pool_call(aave_fixtures):
+    """Test that _encode_pool_call matches web3's ABI encoding of the Pool functions."""
+    pool_contract = Web3().eth.contract(abi=POOL_ABI)
+    asset = aave_fixtures["asset_addresses"]["weth"]
+    user = "0x1234567890123456789012345678901234567890"
+    calls = {
+        "supply": [asset, 10**18, user, 0],
+        "withdraw": [asset, 2**256 - 1, user],
+        "borrow": [asset, 10**6, 2, 0, user],
+        "repay": [asset, 10**6, 2, user],
+    }
+    for function_name, args in calls.items():
+        expected = pool_contract.encode_abi(function_name, args=args)
+        assert _encode_pool_call(function_name, args) == expected
+
+def test_write_helpers_send_encoded_calldata(aave_wallet, aave_fixtures):
+    """Test that approve and setUserUseReserveAsCollateral calldata matches web3's encoding."""
+    asset = aave_fixtures["asset_addresses"]["weth"]
+    pool = Web3.to_checksum_address(aave_fixtures["pool_address"])
+    aave_wallet.send_transaction.return_value = "0xtx_hash"
+
+    approve_token(aave_wallet, asset, pool, 10**18)
+    expected = Web3().eth.contract(abi=ERC20_ABI).encode_abi("approve", args=[pool, 10**18])
+    assert aave_wallet.send_transaction.call_args.args[0]["data"] == expected
+
+    set_user_use_reserve_as_collateral(aave_wallet, pool, asset, False)
+    expected = Web3().eth.contract(abi=POOL_ABI).encode_abi(
+        "setUserUseReserveAsCollateral", args=[asset, False]
+    )
+    assert aave_wallet.send_transaction.call_args.args[0]["data"] == expected
+
+def test_function_selectors():
+    """Test that the precomputed selectors match the known function selectors."""
+    assert POOL_SELECTORS["supply"].hex() == "617ba037"
+    assert POOL_SELECTORS["getUserAccountData"].hex() == "bf92857c"
+    assert PRICE_ORACLE_SELECTORS["getAssetPrice"].hex() == "b3596f07"
+    assert ERC20_SELECTORS["approve"].hex() == "095ea7b3"
+    assert ERC20_SELECTORS["allowance"].hex() == "dd62ed3e"
+
+def test_get_asset_prices_base_units(aave_wallet, aave_fixtures):
+    """Test that several asset prices are read with a single getAssetsPrices call."""
+    assets = list(aave_fixtures["asset_addresses"].values())
+    aave_wallet.read_contract.return_value = [3000 * 10**8, 10**8]
+
+    prices = get_asset_prices_base_units(aave_wallet, "base-mainnet", assets[:2])
+
+    assert prices == [3000 * 10**8, 10**8]
+    aave_wallet.read_contract.assert_called_once()
+    assert aave_wallet.read_contract.call_args.args[2] == "getAssetsPrices"
+
+def testencode_address_call(aave_fixtures):
+    """Test that encode_address_call matches the ABI encoding of address arguments."""
+    user = "0x1234567890123456789012345678901234567890"
+    pool = aave_fixtures["pool_address"]
+    selector = ERC20_SELECTORS["allowance"]
+
+    assert encode_address_call(selector, user, pool) == selector + encode(
+        ["address", "address"], [user, pool]
+    )
+    for address in (
+        "0x123456789abcdef0",
+        "121234567890123456789012345678901234567890",
+        "0x123456789012345678901234567890123456789g",
+    ):
+        try:
+            encode_address_call(selector, address)
+            raise AssertionError("Should have raised ValueError")
+        except ValueError as e:
+            assert "invalid address" in str(e).lower()
+
+def test_get_users_account_data(aave_wallet):
+    """Test that the account data of several users is read in one Multicall3 call."""
+    users = [
+        "0x1234567890123456789012345678901234567890",
+        "0x0987654321098765432109876543210987654321",
+    ]
+    aave_wallet.read_contract.return_value = [
+        (True, encode(["uint256"] * 6, [100 * 10**8, 50 * 10**8, 0, 8300, 8000, 2 * 10**18])),
+        (False, b""),
+    ]
+
+    account_data = get_users_account_data(aave_wallet, "base-mainnet", users)
+
+    assert account_data[0]["totalDebtBaseUnits"] == 50 * 10**8
+    assert account_data[0]["healthFactor"] == 2.0
+    assert account_data[1] is None
+    aave_wallet.read_contract.assert_called_once()
+    assert len(aave_wallet.read_contract.call_args.kwargs["args"][0]) == 2
+
+def test_set_collateral(aave_provider, aave_wallet):
+    """Test that set_collateral reports the collateral and health factor after the change."""
+    with (
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_health_factor"
+        ) as mock_get_health_factor,
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.set_user_use_reserve_as_collateral"
+        ) as mock_set_collateral,
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_user_account_data"
+        ) as mock_get_user_account_data,
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_symbol"
+        ) as mock_get_token_symbol,
+    ):
+        mock_get_health_factor.return_value = 1.5
+        mock_set_collateral.return_value = "0xabcdef"
+        mock_get_user_account_data.return_value = parse_user_account_data(
+            (2500 * 10**8, 1000 * 10**8, 0, 8300, 8000, 2 * 10**18)
+        )
+        mock_get_token_symbol.return_value = "WETH"
+
+        result = aave_provider.set_collateral(aave_wallet, {"asset_id": "weth"})
+
+        assert "Successfully enabled WETH as collateral." in result
+        assert "Transaction hash: 0xabcdef" in result
+        assert f"Total collateral now: 2500.00 USD ({2500 * 10**8} base units)" in result
+        assert "Health factor changed from 1.50 to 2.00" in result
+        mock_get_user_account_data.assert_called_once()
+
+def test_get_portfolio_read_error(aave_provider, aave_wallet):
+    """Test that a failed account data read is reported by the portfolio action."""
+    aave_wallet.read_contract.side_effect = Exception("RPC unavailable")
+
+    response = aave_provider.get_portfolio(aave_wallet, {})
+
+    assert response == "Error getting portfolio details from Aave: RPC unavailable"
@@ -147,3 +147,12 @@ def test_aave_set_collateral_schema_invalid():
     # suggest it should accept specific values
     # If validation fails in future, this test should be modified
     # or the schema should be updated to use Literal
+
+
+def test_aave_schema_config():
+    """Test that Aave schemas strip whitespace from strings and are read-only."""
+    schema = AaveSupplySchema(asset_id="weth", amount=" 1.5 ")
+    assert schema.amount == "1.5"
+
+    with pytest.raises(ValidationError):
+        schema.amount = "2"
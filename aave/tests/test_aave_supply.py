@@ -1,6 +1,7 @@
 from decimal import Decimal
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
+from coinbase_agentkit.action_providers.aave.constants import RECEIPT_POLL_LATENCY
 from coinbase_agentkit.network import Network
 
 
@@ -15,41 +16,34 @@ def test_supply_action_success(aave_wallet, aave_provider):
             "coinbase_agentkit.action_providers.aave.aave_action_provider.format_amount_from_decimals"
         ) as mock_format_from_decimals,
         patch(
-            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_symbol"
-        ) as mock_get_token_symbol,
-        patch("coinbase_agentkit.action_providers.aave.aave_action_provider.Web3") as mock_web3,
+            "coinbase_agentkit.action_providers.aave.aave_action_provider._encode_pool_call"
+        ) as mock_encode_pool_call,
         patch(
-            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_health_factor"
-        ) as mock_get_health_factor,
-        patch(
-            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_balance"
-        ) as mock_get_token_balance,
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_user_account_data"
+        ) as mock_get_user_account_data,
         patch(
             "coinbase_agentkit.action_providers.aave.aave_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
-        patch(
-            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_decimals"
-        ) as mock_get_token_decimals,
+        patch.object(provider, "_fetch_action_context") as mock_fetch_action_context,
         patch(
             "coinbase_agentkit.action_providers.aave.aave_action_provider.approve_token"
         ) as mock_approve_token,
     ):
         # Setup mocks for utility functions
-        mock_get_token_decimals.return_value = 18
         atomic_amount = int(Decimal("1.0") * Decimal(10**18))
         mock_format_amount_with_decimals.return_value = atomic_amount
-        mock_get_token_balance.return_value = atomic_amount * 2  # Ensure sufficient balance
-        # First call returns current health, second call returns new health
-        mock_get_health_factor.side_effect = [Decimal("2.0"), Decimal("3.0")]
-        mock_get_token_symbol.return_value = "WETH"
+        mock_fetch_action_context.return_value = {
+            "decimals": 18,
+            "symbol": "WETH",
+            "balance": atomic_amount * 2,  # Ensure sufficient balance
+            "allowance": 0,
+            "account_data": {"healthFactor": 2.0},
+        }
+        mock_get_user_account_data.return_value = {"healthFactor": 3.0}
         mock_format_from_decimals.return_value = "1"
         mock_approve_token.return_value = "0xapprove_tx_hash"
 
-        # Setup Web3 mock
-        mock_contract = MagicMock()
-        mock_contract.encode_abi.return_value = "encoded_supply_data"
-        mock_web3.return_value.eth.contract.return_value = mock_contract
-        mock_web3.to_checksum_address.side_effect = lambda addr: addr
+        mock_encode_pool_call.return_value = "0xencoded_supply_data"
 
         # Setup wallet mock for transaction
         aave_wallet.send_transaction.return_value = "0xtx_hash"
@@ -65,7 +59,47 @@ def test_supply_action_success(aave_wallet, aave_provider):
 
         # Verify the transaction was sent
         aave_wallet.send_transaction.assert_called_once()
-        aave_wallet.wait_for_transaction_receipt.assert_called_once_with("0xtx_hash")
+        aave_wallet.wait_for_transaction_receipt.assert_called_once_with(
+            "0xtx_hash", poll_latency=RECEIPT_POLL_LATENCY
+        )
+        # Post-transaction state is read in a single call
+        mock_get_user_account_data.assert_called_once()
+
+
+def test_supply_skips_approval_with_sufficient_allowance(aave_wallet, aave_provider):
+    """Test that supply doesn't send an approval when the allowance already covers the amount."""
+    provider = aave_provider
+    input_args = {"asset_id": "weth", "amount": "1", "referral_code": 0}
+
+    with (
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider._encode_pool_call"
+        ) as mock_encode_pool_call,
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_user_account_data"
+        ) as mock_get_user_account_data,
+        patch.object(provider, "_fetch_action_context") as mock_fetch_action_context,
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.approve_token"
+        ) as mock_approve_token,
+    ):
+        mock_fetch_action_context.return_value = {
+            "decimals": 18,
+            "symbol": "WETH",
+            "balance": 2 * 10**18,
+            "allowance": 2**256 - 1,
+            "account_data": {"healthFactor": 2.0},
+        }
+        mock_get_user_account_data.return_value = {"healthFactor": 3.0}
+        mock_encode_pool_call.return_value = "0xencoded_supply_data"
+        aave_wallet.send_transaction.return_value = "0xtx_hash"
+
+        result = provider.supply(aave_wallet, input_args)
+
+        assert "Successfully supplied" in result
+        assert mock_fetch_action_context.call_args.kwargs["include_allowance"] is True
+        mock_approve_token.assert_not_called()
+        aave_wallet.send_transaction.assert_called_once()
 
 
 def test_supply_unsupported_network(aave_wallet, aave_provider):
@@ -110,11 +144,9 @@ def test_supply_token_contract_error(aave_wallet, aave_provider):
         "referral_code": 0,
     }
 
-    with patch(
-        "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_decimals"
-    ) as mock_get_token_decimals:
+    with patch.object(aave_provider, "_fetch_action_context") as mock_fetch_action_context:
         # Simulate error with token contract
-        mock_get_token_decimals.side_effect = Exception("Contract not accessible")
+        mock_fetch_action_context.side_effect = Exception("Contract not accessible")
 
         result = aave_provider.supply(aave_wallet, input_args)
 
@@ -134,22 +166,21 @@ def test_supply_insufficient_balance(aave_wallet, aave_provider):
         patch(
             "coinbase_agentkit.action_providers.aave.aave_action_provider.format_amount_from_decimals"
         ) as mock_format_from_decimals,
-        patch(
-            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_balance"
-        ) as mock_get_token_balance,
         patch(
             "coinbase_agentkit.action_providers.aave.aave_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
-        patch(
-            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_decimals"
-        ) as mock_get_token_decimals,
+        patch.object(aave_provider, "_fetch_action_context") as mock_fetch_action_context,
     ):
         # Setup mocks for utility functions
-        mock_get_token_decimals.return_value = 18
         requested_amount = int(Decimal("5.0") * Decimal(10**18))
         wallet_amount = int(Decimal("2.0") * Decimal(10**18))
         mock_format_amount_with_decimals.return_value = requested_amount
-        mock_get_token_balance.return_value = wallet_amount
+        mock_fetch_action_context.return_value = {
+            "decimals": 18,
+            "symbol": "WETH",
+            "balance": wallet_amount,
+            "account_data": {"healthFactor": float("inf")},
+        }
         mock_format_from_decimals.return_value = "2"
 
         result = aave_provider.supply(aave_wallet, input_args)
@@ -159,7 +190,9 @@ def test_supply_insufficient_balance(aave_wallet, aave_provider):
 
 
 def test_supply_balance_check_error(aave_wallet, aave_provider):
-    """Test supply action when there's an error checking the balance."""
+    """Test supply action when Multicall3 is unavailable and the balance read fails."""
+    user = "0x1234567890123456789012345678901234567890"
+    aave_wallet.get_address.return_value = user
     input_args = {
         "asset_id": "usdc",
         "amount": "10",
@@ -167,20 +200,23 @@ def test_supply_balance_check_error(aave_wallet, aave_provider):
     }
 
     with (
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.batch_read"
+        ) as mock_batch_read,
         patch(
             "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_balance"
         ) as mock_get_token_balance,
         patch(
-            "coinbase_agentkit.action_providers.aave.aave_action_provider.format_amount_with_decimals"
-        ) as mock_format_amount_with_decimals,
+            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_symbol"
+        ) as mock_get_token_symbol,
         patch(
             "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_decimals"
         ) as mock_get_token_decimals,
     ):
-        # Setup mocks for utility functions
+        # Simulate Multicall3 not being available so reads fall back to individual calls
+        mock_batch_read.side_effect = Exception("Multicall3 not deployed")
         mock_get_token_decimals.return_value = 6
-        requested_amount = int(Decimal("10.0") * Decimal(10**6))
-        mock_format_amount_with_decimals.return_value = requested_amount
+        mock_get_token_symbol.return_value = "USDC"
         # Simulate error checking balance
         mock_get_token_balance.side_effect = Exception(
             "Could not transact with/call contract function"
@@ -188,6 +224,9 @@ def test_supply_balance_check_error(aave_wallet, aave_provider):
 
         result = aave_provider.supply(aave_wallet, input_args)
 
+        mock_batch_read.assert_called_once()
+        mock_get_token_balance.assert_called_once()
+        assert mock_get_token_balance.call_args.args[2] == user
         assert "Error: Could not check balance for usdc on base-mainnet" in result
         assert "token contract may not be properly deployed or accessible" in result
 
@@ -201,24 +240,24 @@ def test_supply_approval_error(aave_wallet, aave_provider):
     }
 
     with (
-        patch(
-            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_balance"
-        ) as mock_get_token_balance,
         patch(
             "coinbase_agentkit.action_providers.aave.aave_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
-        patch(
-            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_decimals"
-        ) as mock_get_token_decimals,
+        patch.object(aave_provider, "_fetch_action_context") as mock_fetch_action_context,
         patch(
             "coinbase_agentkit.action_providers.aave.aave_action_provider.approve_token"
         ) as mock_approve_token,
     ):
         # Setup mocks for utility functions
-        mock_get_token_decimals.return_value = 18
         atomic_amount = int(Decimal("1.0") * Decimal(10**18))
         mock_format_amount_with_decimals.return_value = atomic_amount
-        mock_get_token_balance.return_value = atomic_amount * 2  # Ensure sufficient balance
+        mock_fetch_action_context.return_value = {
+            "decimals": 18,
+            "symbol": "WETH",
+            "balance": atomic_amount * 2,  # Ensure sufficient balance
+            "allowance": 0,
+            "account_data": {"healthFactor": float("inf")},
+        }
         # Simulate approval error
         mock_approve_token.side_effect = Exception("Approval failed")
 
@@ -236,32 +275,30 @@ def test_supply_transaction_error_contract_issue(aave_wallet, aave_provider):
     }
 
     with (
-        patch(
-            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_balance"
-        ) as mock_get_token_balance,
         patch(
             "coinbase_agentkit.action_providers.aave.aave_action_provider.format_amount_with_decimals"
         ) as mock_format_amount_with_decimals,
-        patch(
-            "coinbase_agentkit.action_providers.aave.aave_action_provider.get_token_decimals"
-        ) as mock_get_token_decimals,
+        patch.object(aave_provider, "_fetch_action_context") as mock_fetch_action_context,
         patch(
             "coinbase_agentkit.action_providers.aave.aave_action_provider.approve_token"
         ) as mock_approve_token,
-        patch("coinbase_agentkit.action_providers.aave.aave_action_provider.Web3") as mock_web3,
+        patch(
+            "coinbase_agentkit.action_providers.aave.aave_action_provider._encode_pool_call"
+        ) as mock_encode_pool_call,
     ):
         # Setup mocks for utility functions
-        mock_get_token_decimals.return_value = 6
         atomic_amount = int(Decimal("10.0") * Decimal(10**6))
         mock_format_amount_with_decimals.return_value = atomic_amount
-        mock_get_token_balance.return_value = atomic_amount * 2  # Ensure sufficient balance
+        mock_fetch_action_context.return_value = {
+            "decimals": 6,
+            "symbol": "USDC",
+            "balance": atomic_amount * 2,  # Ensure sufficient balance
+            "allowance": 0,
+            "account_data": {"healthFactor": float("inf")},
+        }
         mock_approve_token.return_value = "0xapprove_tx_hash"
 
-        # Setup Web3 mock
-        mock_contract = MagicMock()
-        mock_contract.encode_abi.return_value = "encoded_supply_data"
-        mock_web3.return_value.eth.contract.return_value = mock_contract
-        mock_web3.to_checksum_address.side_effect = lambda addr: addr
+        mock_encode_pool_call.return_value = "0xencoded_supply_data"
 
         # Simulate transaction error related to contract deployment
         aave_wallet.send_transaction.side_effect = Exception(
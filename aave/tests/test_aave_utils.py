@@ -0,0 +1,62 @@
+import math
+
+import pytest
+
+from coinbase_agentkit.action_providers.aave.utils import (
+    UINT256_MAX,
+    format_amount_from_decimals,
+    format_amount_with_decimals,
+    parse_user_account_data,
+)
+
+
+def test_format_amount_from_decimals():
+    """Test that atomic amounts are formatted without trailing zeros."""
+    assert format_amount_from_decimals(0, 18) == "0"
+    assert format_amount_from_decimals(10**18, 18) == "1"
+    assert format_amount_from_decimals(15 * 10**17, 18) == "1.5"
+    assert format_amount_from_decimals(1_234_500, 6) == "1.2345"
+    assert format_amount_from_decimals(1, 18) == "0.000000000000000001"
+    assert format_amount_from_decimals(100, 0) == "100"
+
+
+def test_format_amount_from_decimals_is_exact():
+    """Test that large amounts are formatted without losing precision."""
+    amount = 123_456_789_012_345_678_901_234_567_890_123
+    assert format_amount_from_decimals(amount, 18) == "123456789012345.678901234567890123"
+
+
+def test_format_amount_with_decimals():
+    """Test that human-readable amounts are converted to atomic units."""
+    assert format_amount_with_decimals("1", 18) == 10**18
+    assert format_amount_with_decimals("100", 6) == 100 * 10**6
+    assert format_amount_with_decimals("1.", 6) == 10**6
+    assert format_amount_with_decimals("0.1", 18) == 10**17
+    assert format_amount_with_decimals("1.2345678", 6) == 1_234_567
+    assert format_amount_with_decimals("1e-6", 6) == 1
+    assert format_amount_with_decimals("2E3", 6) == 2000 * 10**6
+    assert format_amount_with_decimals("max", 18) == 2**256 - 1
+
+
+def test_format_amount_beyond_precomputed_decimals():
+    """Test that amounts are converted for decimals beyond uint256 precision."""
+    assert format_amount_with_decimals("1.5", 80) == 15 * 10**79
+    assert format_amount_from_decimals(15 * 10**79, 80) == "1.5"
+
+
+def test_format_amount_with_decimals_invalid():
+    """Test that malformed amounts are rejected."""
+    for amount in ["", "abc", "1.2.3", "1,5"]:
+        with pytest.raises(ValueError, match="Invalid amount format"):
+            format_amount_with_decimals(amount, 6)
+
+
+def test_parse_user_account_data_health_factor():
+    """Test that only uint256 max is reported as an infinite health factor."""
+    no_debt = parse_user_account_data((100 * 10**8, 0, 80 * 10**8, 8300, 8000, UINT256_MAX))
+    no_collateral = parse_user_account_data((0, 50 * 10**8, 0, 0, 0, 0))
+    healthy = parse_user_account_data((100 * 10**8, 50 * 10**8, 0, 8300, 8000, 2 * 10**18))
+
+    assert no_debt["healthFactor"] == math.inf
+    assert no_collateral["healthFactor"] == 0
+    assert healthy["healthFactor"] == 2.0
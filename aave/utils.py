@@ -1,18 +1,108 @@
 """Utility functions for Aave action provider."""
 
+import math
 from decimal import Decimal
+from functools import lru_cache
+from typing import Any
 
+from eth_abi import decode, encode
 from web3 import Web3
 
 from ...wallet_providers import EvmWalletProvider
-from ..erc20.constants import ERC20_ABI
 from .constants import (
-    POOL_ABI,
+    ERC20_FUNCTION_ABIS,
+    ERC20_SELECTORS,
+    MULTICALL3_ABI,
+    MULTICALL3_ADDRESSES,
     POOL_ADDRESSES,
-    PRICE_ORACLE_ABI,
+    POOL_FUNCTION_ABIS,
+    POOL_SELECTORS,
     PRICE_ORACLE_ADDRESSES,
+    PRICE_ORACLE_FUNCTION_ABIS,
+    RECEIPT_POLL_LATENCY,
+    USER_ACCOUNT_DATA_TYPES,
 )
 
+# Powers of ten for scaling token amounts, covering every decimals value up to uint256 precision
+_POW10 = tuple(10**i for i in range(78))
+
+# Largest uint256, which Aave treats as "all" for withdraw/repay amounts and as "no debt"
+UINT256_MAX = (1 << 256) - 1
+
+# Fixed-point scale of Aave's base currency (USD, 8 decimals)
+_BASE_CURRENCY_SCALE = Decimal(10**8)
+
+# Immutable ERC20 metadata (decimals, symbol), keyed by chain ID and lowercase token address
+_token_metadata_cache: dict[tuple[str | None, str], dict[str, Any]] = {}
+
+
+@lru_cache(maxsize=256)
+def _to_checksum_address(address: str) -> str:
+    """Convert an address to its checksummed form, caching the result.
+
+    Args:
+        address: The address to convert.
+
+    Returns:
+        str: The checksummed address.
+
+    """
+    return Web3.to_checksum_address(address)
+
+
+def encode_address_call(selector: bytes, *addresses: str) -> bytes:
+    """Encode the calldata for a read whose arguments are all addresses.
+
+    Each address is left-padded to a 32-byte word after the selector, which is exactly
+    what the ABI encoder would produce, without going through it.
+
+    Args:
+        selector: The 4-byte selector of the function.
+        *addresses: The address arguments to the function.
+
+    Returns:
+        bytes: The encoded calldata.
+
+    """
+    words = [selector]
+    for address in addresses:
+        if len(address) != 42 or address[:2].lower() != "0x":
+            raise ValueError(f"Invalid address: {address}")
+        try:
+            raw = bytes.fromhex(address[2:])
+        except ValueError as e:
+            raise ValueError(f"Invalid address: {address}") from e
+        words.append(raw.rjust(32, b"\x00"))
+    return b"".join(words)
+
+
+def get_token_metadata_cache(chain_id: str | None, token_address: str) -> dict[str, Any]:
+    """Get the cached metadata of a token.
+
+    Args:
+        chain_id: The chain ID of the token's network.
+        token_address: The address of the token.
+
+    Returns:
+        dict[str, Any]: A copy of the cached metadata, empty if none has been read yet.
+
+    """
+    return dict(_token_metadata_cache.get((chain_id, token_address.lower()), ()))
+
+
+def update_token_metadata_cache(
+    chain_id: str | None, token_address: str, metadata: dict[str, Any]
+) -> None:
+    """Store metadata read from a token's contract in the cache.
+
+    Args:
+        chain_id: The chain ID of the token's network.
+        token_address: The address of the token.
+        metadata: The metadata values that were read, keyed by name.
+
+    """
+    _token_metadata_cache.setdefault((chain_id, token_address.lower()), {}).update(metadata)
+
 
 def get_token_decimals(wallet: EvmWalletProvider, token_address: str) -> int:
     """Get the number of decimals for a token.
@@ -25,13 +115,19 @@ def get_token_decimals(wallet: EvmWalletProvider, token_address: str) -> int:
         int: The number of decimals for the token.
 
     """
-    result = wallet.read_contract(
-        contract_address=Web3.to_checksum_address(token_address),
-        abi=ERC20_ABI,
+    chain_id = wallet.get_network().chain_id
+    metadata = get_token_metadata_cache(chain_id, token_address)
+    if "decimals" in metadata:
+        return metadata["decimals"]
+
+    decimals = wallet.read_contract(
+        contract_address=_to_checksum_address(token_address),
+        abi=ERC20_FUNCTION_ABIS["decimals"],
         function_name="decimals",
         args=[],
     )
-    return result
+    update_token_metadata_cache(chain_id, token_address, {"decimals": decimals})
+    return decimals
 
 
 def get_token_symbol(wallet: EvmWalletProvider, token_address: str) -> str:
@@ -45,33 +141,88 @@ def get_token_symbol(wallet: EvmWalletProvider, token_address: str) -> str:
         str: The token symbol.
 
     """
-    return wallet.read_contract(
-        contract_address=Web3.to_checksum_address(token_address),
-        abi=ERC20_ABI,
+    chain_id = wallet.get_network().chain_id
+    metadata = get_token_metadata_cache(chain_id, token_address)
+    if "symbol" in metadata:
+        return metadata["symbol"]
+
+    symbol = wallet.read_contract(
+        contract_address=_to_checksum_address(token_address),
+        abi=ERC20_FUNCTION_ABIS["symbol"],
         function_name="symbol",
         args=[],
     )
+    update_token_metadata_cache(chain_id, token_address, {"symbol": symbol})
+    return symbol
 
 
-def get_token_balance(wallet: EvmWalletProvider, token_address: str) -> int:
-    """Get the balance of a token for the wallet.
+def get_token_balance(
+    wallet: EvmWalletProvider, token_address: str, owner: str | None = None
+) -> int:
+    """Get the balance of a token for an account.
 
     Args:
         wallet: The wallet provider for reading from contracts.
         token_address: The address of the token.
+        owner: Optional address of the token holder. Defaults to wallet address.
 
     Returns:
         int: The balance in atomic units.
 
     """
+    if not owner:
+        owner = wallet.get_address()
+
     return wallet.read_contract(
-        contract_address=Web3.to_checksum_address(token_address),
-        abi=ERC20_ABI,
+        contract_address=_to_checksum_address(token_address),
+        abi=ERC20_FUNCTION_ABIS["balanceOf"],
         function_name="balanceOf",
-        args=[wallet.get_address()],
+        args=[owner],
     )
 
 
+def get_token_allowance(
+    wallet: EvmWalletProvider,
+    token_address: str,
+    spender_address: str,
+    owner: str | None = None,
+) -> int:
+    """Get the amount of a token the spender is allowed to transfer from an account.
+
+    Args:
+        wallet: The wallet provider for reading from contracts.
+        token_address: The address of the token.
+        spender_address: The address of the spender (Pool contract).
+        owner: Optional address of the token holder. Defaults to wallet address.
+
+    Returns:
+        int: The allowance in atomic units.
+
+    """
+    if not owner:
+        owner = wallet.get_address()
+
+    return wallet.read_contract(
+        contract_address=_to_checksum_address(token_address),
+        abi=ERC20_FUNCTION_ABIS["allowance"],
+        function_name="allowance",
+        args=[owner, _to_checksum_address(spender_address)],
+    )
+
+
+def _pow10(exponent: int) -> int:
+    """Get a power of ten, from the precomputed table when it covers the exponent.
+
+    Args:
+        exponent: The exponent, typically a token's decimals.
+
+    Returns:
+        int: 10 raised to the exponent.
+
+    """
+    return _POW10[exponent] if exponent < len(_POW10) else 10**exponent
+
+
 def format_amount_with_decimals(amount: str, decimals: int) -> int:
     """Format a human-readable amount with the correct number of decimals.
 
@@ -83,27 +234,23 @@ def format_amount_with_decimals(amount: str, decimals: int) -> int:
         int: The amount in atomic units.
 
     """
-    try:
-        if amount == "max":
-            return 2**256 - 1  # uint256 max for Aave's withdraw/repay all
+    if amount == "max":
+        return UINT256_MAX  # Aave's withdraw/repay all
 
+    try:
         # Handle scientific notation
-        if "e" in amount.lower():
-            amount_decimal = Decimal(amount)
-            return int(amount_decimal * (10**decimals))
-
-        # Handle regular decimal notation
-        parts = amount.split(".")
-        if len(parts) == 1:
-            return int(parts[0]) * (10**decimals)
-
-        whole, fraction = parts
-        if len(fraction) > decimals:
-            fraction = fraction[:decimals]
-        else:
-            fraction = fraction.ljust(decimals, "0")
-
-        return int(whole) * (10**decimals) + int(fraction)
+        if "e" in amount or "E" in amount:
+            return int(Decimal(amount) * _pow10(decimals))
+
+        # Handle regular decimal notation, whole amounts being the common case
+        whole, _, fraction = amount.partition(".")
+        if not fraction:
+            return int(whole) * _pow10(decimals)
+        if "." in fraction:
+            raise ValueError("More than one decimal point")
+
+        # Truncate or pad the fraction to the token's decimals
+        return int(whole) * _pow10(decimals) + int(fraction[:decimals].ljust(decimals, "0"))
     except ValueError as e:
         raise ValueError(f"Invalid amount format: {amount}") from e
 
@@ -119,13 +266,12 @@ def format_amount_from_decimals(amount: int, decimals: int) -> str:
         str: The amount as a human-readable string.
 
     """
-    if amount == 0:
-        return "0"
+    whole, fraction = divmod(amount, _pow10(decimals))
+    if fraction == 0:
+        return str(whole)
 
-    amount_decimal = Decimal(amount) / (10**decimals)
-    # Format to remove trailing zeros and decimal point if whole number
-    s = str(amount_decimal)
-    return s.rstrip("0").rstrip(".") if "." in s else s
+    # Pad the fraction to the token's decimals and remove trailing zeros
+    return f"{whole}.{str(fraction).zfill(decimals).rstrip('0')}"
 
 
 def approve_token(
@@ -143,26 +289,23 @@ def approve_token(
         str: Transaction hash of the approval transaction.
 
     """
-    token_contract = Web3().eth.contract(
-        address=Web3.to_checksum_address(token_address), abi=ERC20_ABI
-    )
-    encoded_data = token_contract.encode_abi(
-        "approve", args=[Web3.to_checksum_address(spender_address), amount]
+    encoded_data = ERC20_SELECTORS["approve"] + encode(
+        ["address", "uint256"], [_to_checksum_address(spender_address), amount]
     )
 
     params = {
-        "to": Web3.to_checksum_address(token_address),
-        "data": encoded_data,
+        "to": _to_checksum_address(token_address),
+        "data": "0x" + encoded_data.hex(),
     }
 
     tx_hash = wallet.send_transaction(params)
-    wallet.wait_for_transaction_receipt(tx_hash)
+    wallet.wait_for_transaction_receipt(tx_hash, poll_latency=RECEIPT_POLL_LATENCY)
     return tx_hash
 
 
 def get_user_account_data(
     wallet: EvmWalletProvider, pool_address: str, account: str | None = None
-) -> dict[str, Decimal | str | int]:
+) -> dict[str, Decimal | float | int]:
     """Get user account data from Aave pool.
 
     Args:
@@ -171,7 +314,9 @@ def get_user_account_data(
         account: Optional account address. Defaults to wallet address.
 
     Returns:
-        Dict[str, Union[Decimal, str, int]]: Dictionary containing account data.
+        dict[str, Decimal | float | int]: Dictionary containing account data. USD amounts
+            are Decimals; the LTV, liquidation threshold and health factor are floats, the
+            health factor being infinite when the user has no debt.
 
     """
     if not account:
@@ -179,12 +324,27 @@ def get_user_account_data(
 
     # Get account data
     result = wallet.read_contract(
-        contract_address=Web3.to_checksum_address(pool_address),
-        abi=POOL_ABI,
+        contract_address=_to_checksum_address(pool_address),
+        abi=POOL_FUNCTION_ABIS["getUserAccountData"],
         function_name="getUserAccountData",
         args=[account],
     )
 
+    return parse_user_account_data(result)
+
+
+def parse_user_account_data(result: tuple[int, ...]) -> dict[str, Decimal | float | int]:
+    """Parse the raw result of Pool.getUserAccountData.
+
+    Args:
+        result: The raw tuple returned by getUserAccountData.
+
+    Returns:
+        dict[str, Decimal | float | int]: Dictionary containing account data. USD amounts
+            are Decimals; the LTV, liquidation threshold and health factor are floats, the
+            health factor being infinite when the user has no debt.
+
+    """
     (
         total_collateral_base,
         total_debt_base,
@@ -196,14 +356,14 @@ def get_user_account_data(
 
     return {
         # Convert base units (scaled by 10^8) to USD values
-        "totalCollateralUSD": Decimal(total_collateral_base) / Decimal(10**8),
-        "totalDebtUSD": Decimal(total_debt_base) / Decimal(10**8),
-        "availableBorrowsUSD": Decimal(available_borrows_base) / Decimal(10**8),
-        "currentLiquidationThreshold": Decimal(current_liquidation_threshold) / Decimal(10**4),
-        "ltv": Decimal(ltv) / Decimal(10**4),
-        "healthFactor": Decimal(health_factor) / Decimal(10**18)
-        if health_factor > 0
-        else Decimal("inf"),
+        "totalCollateralUSD": Decimal(total_collateral_base) / _BASE_CURRENCY_SCALE,
+        "totalDebtUSD": Decimal(total_debt_base) / _BASE_CURRENCY_SCALE,
+        "availableBorrowsUSD": Decimal(available_borrows_base) / _BASE_CURRENCY_SCALE,
+        # Ratios are only displayed, so plain floats are precise enough
+        "currentLiquidationThreshold": current_liquidation_threshold / 10**4,
+        "ltv": ltv / 10**4,
+        # Aave reports uint256 max when there is no debt
+        "healthFactor": math.inf if health_factor == UINT256_MAX else health_factor / 10**18,
         # Add raw values in base units
         "totalCollateralBaseUnits": total_collateral_base,
         "totalDebtBaseUnits": total_debt_base,
@@ -211,9 +371,44 @@ def get_user_account_data(
     }
 
 
+def get_users_account_data(
+    wallet: EvmWalletProvider, network_id: str, users: list[str]
+) -> list[dict[str, Decimal | float | int] | None]:
+    """Get the Aave account data of several users in a single Multicall3 call.
+
+    Args:
+        wallet: The wallet provider for reading from contracts.
+        network_id: The network ID (e.g. "base-mainnet").
+        users: The addresses of the users.
+
+    Returns:
+        list[dict[str, Decimal | float | int] | None]: The account data of each user, in
+            order, or None for a user whose read failed.
+
+    """
+    pool_address = POOL_ADDRESSES.get(network_id)
+    if not pool_address:
+        raise ValueError(f"Pool address not found for network {network_id}")
+
+    selector = POOL_SELECTORS["getUserAccountData"]
+    reads = [
+        (
+            pool_address,
+            encode_address_call(selector, user),
+            USER_ACCOUNT_DATA_TYPES,
+        )
+        for user in users
+    ]
+
+    return [
+        parse_user_account_data(result) if result is not None else None
+        for result in batch_read(wallet, network_id, reads)
+    ]
+
+
 def get_health_factor(
     wallet: EvmWalletProvider, pool_address: str, account: str | None = None
-) -> Decimal:
+) -> float:
     """Get the current health factor for a user.
 
     Args:
@@ -222,10 +417,10 @@ def get_health_factor(
         account: Optional account address. Defaults to wallet address.
 
     Returns:
-        Decimal: The current health factor.
+        float: The current health factor.
 
     """
-    account_data = get_user_account_data(wallet, Web3.to_checksum_address(pool_address), account)
+    account_data = get_user_account_data(wallet, pool_address, account)
     return account_data["healthFactor"]
 
 
@@ -246,85 +441,80 @@ def get_portfolio_details_markdown(
     if not account:
         account = wallet.get_address()
 
-    try:
-        # Get the Pool contract address
-        pool_address = Web3.to_checksum_address(POOL_ADDRESSES[network_id])
+    # Get the Pool contract address, already checksummed in the constants
+    pool_address = POOL_ADDRESSES.get(network_id)
+    if not pool_address:
+        raise ValueError(f"Pool address not found for network {network_id}")
 
-        # Get user account data from Pool contract
-        account_data = get_user_account_data(wallet, pool_address, account)
-
-        # Format the account data into markdown
-        markdown = f"# Aave Portfolio for {account[:6]}...{account[-4:]}\n\n"
-
-        # Format ETH values with scientific notation for small amounts
-        def format_eth(value):
-            if abs(value) < 1e-4:
-                return f"{value:.2e}"
-            return f"{value:.18f}"
+    # Get user account data from Pool contract
+    account_data = get_user_account_data(wallet, pool_address, account)
 
+    # Format the account data into markdown, collecting the parts and joining them once
+    parts = [
+        f"# Aave Portfolio for {account[:6]}...{account[-4:]}\n\n",
         # Summary section
-        markdown += "## Summary\n\n"
-        markdown += f"**Total Collateral (USD):** {account_data['totalCollateralUSD']:.3f}\n"
-        markdown += (
-            f"**Total Collateral (Base Units):** {account_data['totalCollateralBaseUnits']}\n"
+        "## Summary\n\n",
+        f"**Total Collateral (USD):** {account_data['totalCollateralUSD']:.3f}\n",
+        f"**Total Collateral (Base Units):** {account_data['totalCollateralBaseUnits']}\n",
+        f"**Total Debt (USD):** {account_data['totalDebtUSD']:.3f}\n",
+        f"**Total Debt (Base Units):** {account_data['totalDebtBaseUnits']}\n",
+        f"**Available to Borrow (USD):** {account_data['availableBorrowsUSD']:.3f}\n",
+        f"**Available to Borrow (Base Units):** {account_data['availableBorrowsBaseUnits']}\n",
+        f"**Liquidation Threshold:** {account_data['currentLiquidationThreshold']:.3%}\n",
+        f"**Loan to Value:** {account_data['ltv']:.3%}\n",
+    ]
+
+    # Health factor with color indicators
+    health_factor = account_data["healthFactor"]
+    if health_factor == math.inf:
+        parts.append("**Health Factor:** ∞ (No borrows)\n")
+    elif health_factor >= 2:
+        parts.append(f"**Health Factor:** {health_factor:.3f} (Healthy)\n")
+    elif health_factor >= 1.1:
+        parts.append(f"**Health Factor:** {health_factor:.3f} (Caution)\n")
+    else:
+        parts.append(f"**Health Factor:** {health_factor:.3f} (Danger - Risk of Liquidation)\n")
+
+    # Add recommendations section
+    parts.append("\n## Recommendations\n\n")
+
+    # Check if there's actually debt or collateral
+    has_collateral = account_data["totalCollateralBaseUnits"] > 0
+    has_debt = account_data["totalDebtBaseUnits"] > 0
+    low_health = health_factor < 1.5 and health_factor != math.inf
+
+    if has_collateral and has_debt:
+        parts.append(
+            f"- You have borrowed {account_data['totalDebtUSD']:.2f} USD ({account_data['totalDebtBaseUnits']}) against your collateral. "
         )
-        markdown += f"**Total Debt (USD):** {account_data['totalDebtUSD']:.3f}\n"
-        markdown += f"**Total Debt (Base Units):** {account_data['totalDebtBaseUnits']}\n"
-        markdown += f"**Available to Borrow (USD):** {account_data['availableBorrowsUSD']:.3f}\n"
-        markdown += (
-            f"**Available to Borrow (Base Units):** {account_data['availableBorrowsBaseUnits']}\n"
+        if low_health:
+            parts.append(
+                "Your health factor is low, consider repaying some debt or adding more collateral to avoid liquidation.\n"
+            )
+        else:
+            parts.append(
+                "Your position is healthy. You can borrow more or repay your existing debt as needed.\n"
+            )
+    elif has_collateral and not has_debt:
+        parts.append(
+            f"- You have supplied {account_data['totalCollateralUSD']:.2f} USD ({account_data['totalCollateralBaseUnits']}) as collateral but have no borrows. "
+            "You can borrow against your collateral or withdraw if needed.\n"
         )
-        markdown += (
-            f"**Liquidation Threshold:** {account_data['currentLiquidationThreshold']:.3%}\n"
+    elif not has_collateral and not has_debt and low_health:
+        # Special case: No collateral, no debt, but low health factor
+        parts.append(
+            "- Your account shows no collateral and no debt, but has a low health factor. "
+            "This could be due to dust amounts or rounding. Consider adding more collateral to improve your position.\n"
         )
-        markdown += f"**Loan to Value:** {account_data['ltv']:.3%}\n"
-
-        # Health factor with color indicators
-        health_factor = account_data["healthFactor"]
-        if health_factor == Decimal("inf"):
-            markdown += "**Health Factor:** ∞ (No borrows)\n"
-        elif health_factor >= 2:
-            markdown += f"**Health Factor:** {health_factor:.3f} (Healthy)\n"
-        elif health_factor >= 1.1:
-            markdown += f"**Health Factor:** {health_factor:.3f} (Caution)\n"
-        else:
-            markdown += f"**Health Factor:** {health_factor:.3f} (Danger - Risk of Liquidation)\n"
-
-        # Add recommendations section
-        markdown += "\n## Recommendations\n\n"
-
-        # Check if there's actually debt or collateral
-        has_collateral = account_data["totalCollateralBaseUnits"] > 0
-        has_debt = account_data["totalDebtBaseUnits"] > 0
-        low_health = account_data["healthFactor"] < 1.5 and account_data["healthFactor"] != Decimal(
-            "inf"
+    elif not has_collateral and not has_debt:
+        parts.append("- You have no collateral supplied and no borrows in this Aave market.\n")
+    else:
+        # Fallback case
+        parts.append(
+            "- Review your account status and consider adjusting your position based on market conditions.\n"
         )
 
-        if has_collateral and has_debt:
-            markdown += f"- You have borrowed {account_data['totalDebtUSD']:.2f} USD ({account_data['totalDebtBaseUnits']}) against your collateral. "
-            if low_health:
-                markdown += "Your health factor is low, consider repaying some debt or adding more collateral to avoid liquidation.\n"
-            else:
-                markdown += "Your position is healthy. You can borrow more or repay your existing debt as needed.\n"
-        elif has_collateral and not has_debt:
-            markdown += f"- You have supplied {account_data['totalCollateralUSD']:.2f} USD ({account_data['totalCollateralBaseUnits']}) as collateral but have no borrows. "
-            markdown += "You can borrow against your collateral or withdraw if needed.\n"
-        elif not has_collateral and not has_debt and low_health:
-            # Special case: No collateral, no debt, but low health factor
-            markdown += (
-                "- Your account shows no collateral and no debt, but has a low health factor. "
-            )
-            markdown += "This could be due to dust amounts or rounding. Consider adding more collateral to improve your position.\n"
-        elif not has_collateral and not has_debt:
-            markdown += "- You have no collateral supplied and no borrows in this Aave market.\n"
-        else:
-            # Fallback case
-            markdown += "- Review your account status and consider adjusting your position based on market conditions.\n"
-
-        return markdown
-    except Exception as e:
-        # If there was an error fetching data, return an error message
-        return f"Error fetching Aave portfolio: {e!s}"
+    return "".join(parts)
 
 
 def set_user_use_reserve_as_collateral(
@@ -342,28 +532,24 @@ def set_user_use_reserve_as_collateral(
         str: Transaction hash of the operation.
 
     """
-    pool_contract = Web3().eth.contract(
-        address=Web3.to_checksum_address(pool_address), abi=POOL_ABI
-    )
-    encoded_data = pool_contract.encode_abi(
-        "setUserUseReserveAsCollateral",
-        args=[Web3.to_checksum_address(asset_address), use_as_collateral],
+    encoded_data = POOL_SELECTORS["setUserUseReserveAsCollateral"] + encode(
+        ["address", "bool"], [_to_checksum_address(asset_address), use_as_collateral]
     )
 
     params = {
-        "to": Web3.to_checksum_address(pool_address),
-        "data": encoded_data,
+        "to": _to_checksum_address(pool_address),
+        "data": "0x" + encoded_data.hex(),
     }
 
     tx_hash = wallet.send_transaction(params)
-    wallet.wait_for_transaction_receipt(tx_hash)
+    wallet.wait_for_transaction_receipt(tx_hash, poll_latency=RECEIPT_POLL_LATENCY)
     return tx_hash
 
 
-def get_asset_price_from_oracle(
+def get_asset_price_base_units(
     wallet: EvmWalletProvider, network_id: str, asset_address: str
-) -> Decimal:
-    """Get the price of an asset from the Aave Price Oracle.
+) -> int:
+    """Get the raw price of an asset from the Aave Price Oracle.
 
     Args:
         wallet: The wallet provider for reading from contracts.
@@ -371,20 +557,97 @@ def get_asset_price_from_oracle(
         asset_address: The address of the asset to get the price for.
 
     Returns:
-        Decimal: The price of the asset in USD (scaled by 10^8).
+        int: The price of the asset in base currency units (USD scaled by 10^8).
 
     """
     oracle_address = PRICE_ORACLE_ADDRESSES.get(network_id)
     if not oracle_address:
         raise ValueError(f"Price oracle address not found for network {network_id}")
 
-    # Get asset price
-    asset_price = wallet.read_contract(
-        Web3.to_checksum_address(oracle_address),
-        PRICE_ORACLE_ABI,
+    return wallet.read_contract(
+        oracle_address,
+        PRICE_ORACLE_FUNCTION_ABIS["getAssetPrice"],
         "getAssetPrice",
-        [Web3.to_checksum_address(asset_address)],
+        [_to_checksum_address(asset_address)],
+    )
+
+
+def get_asset_prices_base_units(
+    wallet: EvmWalletProvider, network_id: str, asset_addresses: list[str]
+) -> list[int]:
+    """Get the raw prices of several assets from the Aave Price Oracle in a single call.
+
+    Args:
+        wallet: The wallet provider for reading from contracts.
+        network_id: The network ID (e.g. "base-mainnet").
+        asset_addresses: The addresses of the assets to get the prices for.
+
+    Returns:
+        list[int]: The price of each asset in base currency units (USD scaled by 10^8), in order.
+
+    """
+    oracle_address = PRICE_ORACLE_ADDRESSES.get(network_id)
+    if not oracle_address:
+        raise ValueError(f"Price oracle address not found for network {network_id}")
+
+    return list(
+        wallet.read_contract(
+            oracle_address,
+            PRICE_ORACLE_FUNCTION_ABIS["getAssetsPrices"],
+            "getAssetsPrices",
+            [[_to_checksum_address(address) for address in asset_addresses]],
+        )
     )
 
-    # Convert to decimal with proper scaling
-    return Decimal(asset_price) / Decimal(10**8)
+
+def multicall(
+    wallet: EvmWalletProvider, network_id: str, calls: list[tuple[str, bytes]]
+) -> list[tuple[bool, bytes]]:
+    """Execute several contract reads in a single Multicall3 aggregate3 call.
+
+    Args:
+        wallet: The wallet provider for reading from contracts.
+        network_id: The network ID (e.g. "base-mainnet").
+        calls: List of (target address, encoded call data) pairs.
+
+    Returns:
+        list[tuple[bool, bytes]]: The (success, return data) pair for each call, in order.
+
+    """
+    multicall_address = MULTICALL3_ADDRESSES.get(network_id)
+    if not multicall_address:
+        raise ValueError(f"Multicall3 address not found for network {network_id}")
+
+    results = wallet.read_contract(
+        contract_address=multicall_address,
+        abi=MULTICALL3_ABI,
+        function_name="aggregate3",
+        args=[[(_to_checksum_address(target), True, data) for target, data in calls]],
+    )
+
+    return [(success, return_data) for success, return_data in results]
+
+
+def batch_read(
+    wallet: EvmWalletProvider, network_id: str, reads: list[tuple[str, bytes, tuple[str, ...]]]
+) -> list[tuple[Any, ...] | None]:
+    """Execute several contract reads in a single Multicall3 call and decode their results.
+
+    All reads are served from the same block, so their results are consistent with each other.
+
+    Args:
+        wallet: The wallet provider for reading from contracts.
+        network_id: The network ID (e.g. "base-mainnet").
+        reads: List of (target address, encoded call data, return types) triples.
+
+    Returns:
+        list[tuple[Any, ...] | None]: The decoded return values of each read, in order, or
+            None for a read that failed.
+
+    """
+    results = multicall(wallet, network_id, [(target, data) for target, data, _ in reads])
+
+    return [
+        decode(types, return_data) if success else None
+        for (_, _, types), (success, return_data) in zip(reads, results, strict=True)
+    ]